@@ -1,10 +1,19 @@
 # hubbledemo/__init__.py
 
-from .elfmgr import flash_elf, fetch_elf, patch_elf, probe_device
+from .elfmgr import (
+    flash_elf,
+    fetch_elf,
+    fetch_elfs,
+    jlink_session,
+    patch_elf,
+    probe_device,
+)
 
 __all__ = [
     "flash_elf",
     "fetch_elf",
+    "fetch_elfs",
+    "jlink_session",
     "patch_elf",
     "probe_device",
 ]
@@ -10,7 +10,8 @@ import petname
 from datetime import timezone, datetime
 from typing import Optional
 from hubblenetwork import Organization, Credentials
-from hubbledemo import flash_elf, fetch_elf, patch_elf, probe_device
+from hubbledemo import flash_elf, fetch_elf, jlink_session, patch_elf, probe_device
+from hubbledemo.elfmgr import _SUPPORTED_BOARDS
 
 
 def _get_env_or_fail(name: str) -> str:
@@ -52,7 +53,10 @@ def probe() -> None:
 
 
 @cli.command("flash")
-@click.argument("board", type=str)
+# Checked up front so an unknown board fails before a device is registered
+@click.argument(
+    "board", type=click.Choice(sorted(_SUPPORTED_BOARDS), case_sensitive=False)
+)
 @click.option(
     "--org-id",
     "-o",
@@ -70,48 +74,52 @@ def probe() -> None:
     help="Token (if not using HUBBLE_API_TOKEN env var)",
 )
 def flash(board: str, name: str = None, org_id: str = None, token: str = None) -> None:
-    if not probe_device():
-        click.secho(
-            "[ERROR] Failed to connect to device. Check your connection.",
-            fg="red",
-            err=True,
-        )
-        return 2
-
-    org_id, token = _get_org_and_token(org_id, token)
-    org = Organization(Credentials(org_id=org_id, api_token=token))
-
-    click.secho(f"[INFO] Organization info acquired:")
-    click.secho(f"\tID: {org.credentials.org_id}")
-    click.secho(f"\tName: {org.name}")
-    click.secho(f"\tEnvironment: {org.env.name}")
-
-    click.secho(f'[INFO] Registering new device"... ', nl=False)
-    device = org.register_device()
-    click.secho("[SUCCESS]")
-    click.secho(f"\tDevice ID:  {device.id}")
-    click.secho(f"\tDevice Key: {device.key}")
-
-    if not name:
-        name = petname.generate(words=3)
-        click.secho(f'[INFO] No name supplied. Naming device "{name}"')
-    click.secho(f"[INFO] Setting device name... ", nl=False)
-    org.set_device_name(device_id=device.id, name=name)
-    click.secho("[SUCCESS]")
-
-    click.secho(f"[INFO] Retrieving binary for {board}... ", nl=False)
-    buf = fetch_elf(board=board)
-    click.secho("[SUCCESS]")
-
-    click.secho("[INFO] Patching key + UTC into binary... ", nl=False)
-    patch_elf(buf, device)
-    click.secho("[SUCCESS]")
-
-    click.secho("[INFO] Flashing binary onto device... ", nl=False)
-    flash_elf(board=board, buf=buf)
-    click.secho("[SUCCESS]")
-
-    click.secho(f"\n{board} successfully flashed and provisioned!")
+    # One pylink.JLink for both the probe and the flash. probe_device opens the
+    # emulator and flash_elf reuses it, so it stays open (and claimed by us)
+    # through registration and download rather than being reopened.
+    with jlink_session() as jlink:
+        if not probe_device(jlink):
+            click.secho(
+                "[ERROR] Failed to connect to device. Check your connection.",
+                fg="red",
+                err=True,
+            )
+            return 2
+
+        org_id, token = _get_org_and_token(org_id, token)
+        org = Organization(Credentials(org_id=org_id, api_token=token))
+
+        click.secho(f"[INFO] Organization info acquired:")
+        click.secho(f"\tID: {org.credentials.org_id}")
+        click.secho(f"\tName: {org.name}")
+        click.secho(f"\tEnvironment: {org.env.name}")
+
+        click.secho(f'[INFO] Registering new device"... ', nl=False)
+        device = org.register_device()
+        click.secho("[SUCCESS]")
+        click.secho(f"\tDevice ID:  {device.id}")
+        click.secho(f"\tDevice Key: {device.key}")
+
+        if not name:
+            name = petname.generate(words=3)
+            click.secho(f'[INFO] No name supplied. Naming device "{name}"')
+        click.secho(f"[INFO] Setting device name... ", nl=False)
+        org.set_device_name(device_id=device.id, name=name)
+        click.secho("[SUCCESS]")
+
+        click.secho(f"[INFO] Retrieving binary for {board}... ", nl=False)
+        buf = fetch_elf(board=board)
+        click.secho("[SUCCESS]")
+
+        click.secho("[INFO] Patching key + UTC into binary... ", nl=False)
+        patch_elf(buf, device)
+        click.secho("[SUCCESS]")
+
+        click.secho("[INFO] Flashing binary onto device... ", nl=False)
+        flash_elf(board=board, buf=buf, jlink=jlink)
+        click.secho("[SUCCESS]")
+
+        click.secho(f"\n{board} successfully flashed and provisioned!")
 
 
 def main(argv: Optional[list[str]] = None) -> int:
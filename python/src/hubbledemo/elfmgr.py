@@ -1,96 +1,171 @@
 from __future__ import annotations
 
-from hubblenetwork import Device
-
 import io
 import os
 import base64
-import requests
+import hashlib
+import platformdirs
+import threading
 import time
+import shutil
 import tempfile
-import pylink
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
-from elftools.elf.elffile import ELFFile
-from elftools.elf.sections import SymbolTableSection
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional
+
+# pylink, pyelftools and urllib3 are imported where they are used so that
+# importing hubbledemo (e.g. for `--help` or `probe`) doesn't pay for all three.
+if TYPE_CHECKING:
+    import pylink
+    import urllib3
+    from elftools.elf.elffile import ELFFile
+    from hubblenetwork import Device
 
 
 _ELF_BASE_URL = (
     "https://raw.githubusercontent.com/HubbleNetwork/hubble-tldm/master/merge"
 )
 
-# Map boards to J-Link "device" strings (extend as needed)
-_BOARD_TO_JLINK_DEVICE: Dict[str, str] = {
-    "nrf52dk": "nRF52832_xxAA",
-    "nrf52840dk": "nRF52840_xxAA",
-    "nrf21540dk": "nRF52840_xxAA",
-    "xg24_ek2703a": "EFR32MG24BxxxF1536",
-    "xg22_ek4108a": "EFR32MG22CxxxF512",
-    "lp_em_cc2340r5": "CC2340R5",
+# Downloads are rejected unless they start with the ELF magic and fit this cap
+_ELF_MAGIC = b"\x7fELF"
+_MAX_ELF_BYTES = 16 * 1024 * 1024
+
+# Upper bound on concurrent downloads; also the per-host connection pool size
+_MAX_PARALLEL_FETCHES = 4
+
+_HTTP: urllib3.PoolManager | None = None
+_HTTP_LOCK = threading.Lock()
+
+
+def _get_http() -> urllib3.PoolManager:
+    """Return the shared HTTP connection pool, creating it on first use."""
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None:
+            import urllib3
+
+            # Transient failures are retried with jittered exponential
+            # backoff, honouring Retry-After on 429/503. Both waits are capped
+            # so a large Retry-After can't stall a fetch for hours.
+            retry = urllib3.Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_jitter=0.25,
+                backoff_max=8.0,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+                retry_after_max=30,
+                raise_on_status=False,
+            )
+
+            # Shared pool so retries and repeat fetches reuse the TCP/TLS connection
+            _HTTP = urllib3.PoolManager(
+                num_pools=2, maxsize=_MAX_PARALLEL_FETCHES, retries=retry
+            )
+        return _HTTP
+
+
+class _BoardInfo(NamedTuple):
+    device: str  # J-Link "device" string
+    sector_bytes: int  # flash erase-sector size
+    speed_khz: int = 8000  # SWD clock used when flashing
+
+
+# Everything flash_elf needs per board. A new board is added with one entry
+# here (keys are already normalized: stripped, lowercase). sector_bytes is
+# used by the incremental flash path, which compares and writes whole sectors
+# so bytes the image doesn't cover are carried over from the readback instead
+# of depending on the J-Link DLL to preserve them.
+_BOARDS: Dict[str, _BoardInfo] = {
+    "nrf52dk": _BoardInfo("nRF52832_xxAA", 4096),
+    "nrf52840dk": _BoardInfo("nRF52840_xxAA", 4096),
+    "nrf21540dk": _BoardInfo("nRF52840_xxAA", 4096),
+    "xg24_ek2703a": _BoardInfo("EFR32MG24BxxxF1536", 8192),
+    "xg22_ek4108a": _BoardInfo("EFR32MG22CxxxF512", 8192),
+    "lp_em_cc2340r5": _BoardInfo("CC2340R5", 2048, speed_khz=4000),
 }
 
+_SUPPORTED_BOARDS = frozenset(_BOARDS)
+
 
 def _compute_file_offset(sym, sec) -> int:
     return sec["sh_offset"] + (sym["st_value"] - sec["sh_addr"])
 
 
-def _get_endianness_from_elf(buf: io.BytesIO) -> str:
-    buf.seek(0)
-    elf = ELFFile(buf)
-    """Return 'little' or 'big' by inspecting the ELF header."""
-    return "little" if elf.little_endian else "big"
-
-
 def _find_symbol(elf: ELFFile, name: str):
     """Return (symbol, section) for a named symbol from .symtab or .dynsym."""
-    for sec in elf.iter_sections():
-        if not isinstance(sec, SymbolTableSection):
+    for sec_name in (".symtab", ".dynsym"):
+        # Look the symbol tables up by name rather than walking every section
+        sec = elf.get_section_by_name(sec_name)
+        if sec is None:
             continue
-        for sym in sec.iter_symbols():
-            if sym.name == name:
-                shndx = sym["st_shndx"]
-                if shndx == "SHN_UNDEF":
-                    raise ValueError(f"Symbol '{name}' is undefined (imported).")
-                if isinstance(shndx, str):
-                    raise ValueError(
-                        f"Symbol '{name}' has special section index {shndx}, cannot patch."
-                    )
-                target_sec = elf.get_section(shndx)
-                if target_sec is None:
-                    raise ValueError(f"Could not find section for symbol '{name}'.")
-                if target_sec.name == "bss":
-                    continue
-                return sym, target_sec
+        # get_symbol_by_name builds (and caches on the section) a name index
+        # on first use, so repeated lookups on the same ELFFile are O(1).
+        for sym in sec.get_symbol_by_name(name) or ():
+            shndx = sym["st_shndx"]
+            if shndx == "SHN_UNDEF":
+                raise ValueError(f"Symbol '{name}' is undefined (imported).")
+            if isinstance(shndx, str):
+                raise ValueError(
+                    f"Symbol '{name}' has special section index {shndx}, cannot patch."
+                )
+            target_sec = elf.get_section(shndx)
+            if target_sec is None:
+                raise ValueError(f"Could not find section for symbol '{name}'.")
+            if target_sec.name == "bss":
+                continue
+            return sym, target_sec
     return None, None
 
 
-def _patch_symbol(buf: io.BytesIO, data: bytes, symbol_name: str):
-    buf.seek(0)
-    elf = ELFFile(buf)
-
-    # Resolve symbol
-    sym, sec = _find_symbol(elf, symbol_name)
-    if sym is None:
-        raise ValueError(f"{symbol_name} not found in elf file")
+def _patch_symbols(elf: ELFFile, buf: io.BytesIO, patches: Dict[str, bytes]):
+    """Resolve every symbol in ``patches`` first, then write them all in one pass."""
+    writes = []
+    for symbol_name, data in patches.items():
+        # Resolve symbol
+        sym, sec = _find_symbol(elf, symbol_name)
+        if sym is None:
+            raise ValueError(f"{symbol_name} not found in elf file")
 
-    file_off = _compute_file_offset(sym, sec)
-    sym_size = int(sym["st_size"]) or 0
+        file_off = _compute_file_offset(sym, sec)
+        sym_size = int(sym["st_size"]) or 0
 
-    if sym_size not in (0, len(data)):
-        raise ValueError(
-            f"Symbol size is {sym_size} bytes, but {symbol_name} length is {len(data)}"
-        )
+        if sym_size not in (0, len(data)):
+            raise ValueError(
+                f"Symbol size is {sym_size} bytes, but {symbol_name} length is {len(data)}"
+            )
+        writes.append((file_off, data))
 
-    buf.seek(file_off)
-    buf.write(data)
+    # Nothing is written unless every symbol resolved and fits. Writing through
+    # the buffer's memoryview copies straight into the backing store and, unlike
+    # seek()+write(), can never grow the buffer on a bad offset.
+    with buf.getbuffer() as view:
+        for file_off, data in writes:
+            view[file_off : file_off + len(data)] = data
 
 
 def patch_elf(buf: io.BytesIO, device: Device):
-    _patch_symbol(buf, base64.b64decode(device.key), "master_key")
+    # Reject malformed keys (stray whitespace, bad padding) before touching the ELF
+    key = base64.b64decode(device.key, validate=True)
+
+    from elftools.elf.elffile import ELFFile
 
-    endian = _get_endianness_from_elf(buf)
+    # Parse the ELF once and reuse it (and its symbol index) for every patch
+    buf.seek(0)
+    elf = ELFFile(buf)
+
+    # Every supported board is a little-endian Cortex-M part
     utc_ms = int(time.time() * 1000)
-    _patch_symbol(buf, utc_ms.to_bytes(8, endian, signed=False), "utc_time")
+    _patch_symbols(
+        elf,
+        buf,
+        {
+            "master_key": key,
+            "utc_time": utc_ms.to_bytes(8, "little", signed=False),
+        },
+    )
 
 
 def _addr_for_segment(seg) -> int:
@@ -108,31 +183,143 @@ def _addr_for_segment(seg) -> int:
 
 def _always_unsecure(title, msg, flags):
     # proceed with mass erase + unlock
+    import pylink
+
     return pylink.enums.JLinkFlags.DLG_BUTTON_YES
 
 
-def probe_device() -> bool:
-    """Returns if any emulators are connected"""
+@contextmanager
+def jlink_session() -> Iterator[pylink.JLink]:
+    """
+    Yield a single pylink.JLink handle to share between probe_device and
+    flash_elf. probe_device opens the emulator and flash_elf reuses the open
+    connection, so the USB open is done once per session. The emulator is
+    closed (if open) when the block exits.
+    """
+    import pylink
+
+    # jlink will silently fail post-mandated FW update of the jlink
+    # for some devices due to a security dialog which pylink ignores.
+    # This unsecure_hook just makes it accept the insecurity.
     jlink = pylink.JLink(unsecure_hook=_always_unsecure)
-    return jlink.num_connected_emulators() > 0
+    try:
+        yield jlink
+    finally:
+        try:
+            if jlink.opened():
+                jlink.close()
+        except Exception:
+            pass
+
+
+def probe_device(jlink: Optional[pylink.JLink] = None) -> bool:
+    """
+    Returns if an emulator is connected and could be opened. A handle from
+    jlink_session() is left open so flash_elf can reuse it.
+    """
+    if jlink is None:
+        with jlink_session() as jlink:
+            return probe_device(jlink)
+
+    import pylink
+
+    if jlink.num_connected_emulators() == 0:
+        return False
+    try:
+        if not jlink.opened():
+            jlink.open()
+    except pylink.errors.JLinkException:
+        return False
+    return True
 
 
-def flash_elf(buf: io.BytesIO, board: str) -> None:
+def _flash_changed_sectors(jlink, buf: io.BytesIO, sector_bytes: int) -> int:
     """
-    Flash an ELF image (held in a BytesIO) to an nRF52832_xxAA using pylink.
-    Creates a temporary .elf on disk (needed by jlink.flash_file) and deletes it afterwards.
+    Program only the erase sectors whose contents differ from the target.
 
-    Args:
-        buf: io.BytesIO positioned anywhere (we'll rewind it).
-        board: board name
+    The PT_LOAD segments are laid over a readback of every sector they touch,
+    so a sector shared by several segments (or partly outside the image) is
+    compared and written as one whole sector with its other bytes preserved.
+    Adjacent changed sectors are written as a single download.
+    If the target can't be read back (e.g. read-protected), every touched
+    sector is written with the gaps left erased (0xFF), as flash_file would.
 
-    Raises:
-        ImportError: pylink not installed.
-        RuntimeError: on J-Link connection or flashing failure.
+    Returns the number of bytes written.
     """
-    speed_khz = 4000
-    device = _BOARD_TO_JLINK_DEVICE.get(board.strip().lower())
+    import pylink
+    from elftools.elf.elffile import ELFFile
 
+    buf.seek(0)
+    elf = ELFFile(buf)
+
+    segments = []
+    for seg in elf.iter_segments():
+        if seg["p_type"] != "PT_LOAD" or not seg["p_filesz"]:
+            continue
+        segments.append((_addr_for_segment(seg), seg.data()))
+
+    # Every sector touched by the image, grouped into contiguous spans so each
+    # span is read back with a single memory_read8
+    sectors = sorted(
+        {
+            base
+            for addr, data in segments
+            for base in range(
+                addr - addr % sector_bytes, addr + len(data), sector_bytes
+            )
+        }
+    )
+    spans = []
+    for base in sectors:
+        if spans and spans[-1][1] == base:
+            spans[-1][1] = base + sector_bytes
+        else:
+            spans.append([base, base + sector_bytes])
+
+    written = 0
+    for start, end in spans:
+        try:
+            current = bytes(jlink.memory_read8(start, end - start))
+        except pylink.errors.JLinkException:
+            current = None
+        # A short read can't be compared sector by sector; treat it as unreadable
+        if current is not None and len(current) != end - start:
+            current = None
+
+        image = bytearray(current if current is not None else b"\xff" * (end - start))
+        for addr, data in segments:
+            lo = max(addr, start)
+            hi = min(addr + len(data), end)
+            if lo < hi:
+                image[lo - start : hi - start] = data[lo - addr : hi - addr]
+
+        # Merge adjacent changed sectors into runs. Each flash_write is one
+        # BeginDownload/EndDownload round-trip, so the loader gets whole runs.
+        # Runs always cover whole sectors, so nothing relies on the DLL's
+        # read-modify-write (only done below SetFlashDLNoRMWThreshold).
+        runs = []
+        for off in range(0, end - start, sector_bytes):
+            sector = image[off : off + sector_bytes]
+            if current is not None and sector == current[off : off + sector_bytes]:
+                continue
+            if runs and runs[-1][1] == off:
+                runs[-1][1] = off + sector_bytes
+            else:
+                runs.append([off, off + sector_bytes])
+
+        for run_start, run_end in runs:
+            jlink.flash_write8(start + run_start, image[run_start:run_end])
+            written += run_end - run_start
+
+    return written
+
+
+def _flash_whole_file(jlink, buf: io.BytesIO) -> None:
+    """
+    Program the image with jlink.flash_file, leaving the DLL to skip sectors
+    that already match. Creates a temporary .elf on disk (needed by
+    jlink.flash_file) and deletes it afterwards.
+    """
     # Write the buffer to a real temp file so flash_file can read it (works on all OSes)
     tmp_path = None
     try:
@@ -140,34 +327,10 @@ def flash_elf(buf: io.BytesIO, board: str) -> None:
             tmp_path = tmp.name
             buf.seek(0)
             # Stream copy to avoid duplicating memory with getvalue()
-            while True:
-                chunk = buf.read(1024 * 1024)
-                if not chunk:
-                    break
-                tmp.write(chunk)
+            shutil.copyfileobj(buf, tmp, 1024 * 1024)
             tmp.flush()
 
-        # jlink will silently fail post-mandated FW update of the jlink
-        # for some devices due to a security dialog which pylink ignores.
-        # This unsecure_hook just makes it accept the insecurity.
-        jlink = pylink.JLink(unsecure_hook=_always_unsecure)
-
-        try:
-            jlink.open()
-            jlink.set_tif(pylink.enums.JLinkInterfaces.SWD)
-            jlink.connect(device, speed=speed_khz)
-
-            jlink.halt()
-            jlink.flash_file(tmp_path, addr=None)  # ELF contains its own load addresses
-            jlink.reset()
-        except Exception as e:
-            raise RuntimeError(f"Flashing failed: {e}") from e
-        finally:
-            try:
-                if jlink.opened():
-                    jlink.close()
-            except Exception:
-                pass
+        jlink.flash_file(tmp_path, addr=None)  # ELF contains its own load addresses
     finally:
         if tmp_path:
             try:
@@ -176,17 +339,87 @@ def flash_elf(buf: io.BytesIO, board: str) -> None:
                 pass
 
 
+def flash_elf(
+    buf: io.BytesIO, board: str, *, jlink: Optional[pylink.JLink] = None
+) -> None:
+    """
+    Flash an ELF image (held in a BytesIO) to the board's target using pylink.
+    The image is programmed with jlink.flash_file. Setting
+    HUBBLE_DEMO_INCREMENTAL_FLASH=1 instead reads the target back and programs
+    only the erase sectors that differ (see _flash_changed_sectors).
+
+    Args:
+        buf: io.BytesIO positioned anywhere (we'll rewind it).
+        board: board name
+        jlink: handle from jlink_session() to reuse, normally already opened
+            by probe_device (opened here if not) and left open for the
+            caller. A private session is used if omitted.
+
+    Raises:
+        ValueError: board is not supported.
+        ImportError: pylink not installed.
+        RuntimeError: on J-Link connection or flashing failure.
+    """
+    board = board.strip().lower()
+    if board not in _SUPPORTED_BOARDS:
+        raise ValueError(f"Unsupported board '{board}'")
+
+    if jlink is None:
+        with jlink_session() as jlink:
+            return flash_elf(buf, board, jlink=jlink)
+
+    import pylink
+
+    info = _BOARDS[board]
+
+    try:
+        if not jlink.opened():
+            jlink.open()
+        jlink.set_tif(pylink.enums.JLinkInterfaces.SWD)
+        jlink.connect(info.device, speed=info.speed_khz)
+
+        jlink.halt()
+        if os.getenv("HUBBLE_DEMO_INCREMENTAL_FLASH") == "1":
+            _flash_changed_sectors(jlink, buf, info.sector_bytes)
+        else:
+            _flash_whole_file(jlink, buf)
+        jlink.reset()
+    except Exception as e:
+        raise RuntimeError(f"Flashing failed: {e}") from e
+
+
+def _elf_cache_paths(base_url: str, board: str) -> tuple[Path, Path]:
+    """Return the (elf, etag) cache paths for a board from a given base URL."""
+    # Key the directory on the base URL so an override never serves stale images
+    url_key = hashlib.sha1(base_url.encode()).hexdigest()[:12]
+    cache_dir = Path(platformdirs.user_cache_dir("hubble-tldm")) / url_key
+    return cache_dir / f"{board}.elf", cache_dir / f"{board}.etag"
+
+
+def _store_cached_elf(elf_path: Path, etag_path: Path, buf: io.BytesIO, etag: str):
+    """Best-effort write-through of a downloaded ELF and its ETag."""
+    try:
+        elf_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = elf_path.with_suffix(".elf.tmp")
+        tmp_path.write_bytes(buf.getbuffer())
+        os.replace(tmp_path, elf_path)
+        etag_path.write_text(etag)
+    except OSError:
+        pass
+
+
 def fetch_elf(board: str, timeout: float = 20.0) -> io.BytesIO:
     """
     Download the board-specific ELF from HubbleNetwork/hubble-tldm/merge and
-    return it as an io.BytesIO.
+    return it as an io.BytesIO. Downloads are cached on disk and revalidated
+    with the server's ETag, so unchanged images are not fetched again.
 
     Parameters
     ----------
     board_name : str
         Board identifier (e.g. 'nrf21540dk', 'xg24_ek2703a', 'xg22_ek4108a').
     timeout : float
-        Requests timeout in seconds (connect + read).
+        HTTP timeout in seconds (connect + read).
 
     Returns
     -------
@@ -204,6 +437,10 @@ def fetch_elf(board: str, timeout: float = 20.0) -> io.BytesIO:
     """
     if not isinstance(board, str) or not board.strip():
         raise ValueError("board must be a non-empty string")
+    board = board.strip().lower()
+    # Fail fast rather than spending a round-trip on a guaranteed 404
+    if board not in _SUPPORTED_BOARDS:
+        raise ValueError(f"Unsupported board '{board}'")
 
     # If we have a local override, just use that
     local_file = os.getenv("HUBBLE_DEMO_ELF_FILE")
@@ -219,44 +456,103 @@ def fetch_elf(board: str, timeout: float = 20.0) -> io.BytesIO:
 
     url = f"{base_url}/{board}.elf"
 
-    _RETRY_STATUS = {429, 500, 502, 503, 504}
-    retries = 5
+    # Revalidate a previously downloaded copy instead of re-fetching it
+    cached_elf, cached_etag = _elf_cache_paths(base_url, board)
+    headers = {}
+    if cached_elf.is_file() and cached_etag.is_file():
+        headers["If-None-Match"] = cached_etag.read_text().strip()
+
+    import urllib3
 
-    last_err: Optional[Exception] = None
-    for attempt in range(1, max(1, retries) + 1):
+    try:
+        # Stream the body so it is written once into the returned buffer
+        # instead of being materialized in full and then copied.
+        resp = _get_http().request(
+            "GET", url, headers=headers, timeout=timeout, preload_content=False
+        )
         try:
-            resp = requests.get(url, timeout=timeout)
+            if resp.status == 304:
+                return io.BytesIO(cached_elf.read_bytes())
 
-            if resp.status_code == 404:
-                # Not found is definitive; don't bother retrying
+            if resp.status == 404:
                 raise FileNotFoundError(f"No ELF for board '{board}' at {url}")
 
-            # Retry transient status codes (unless it's the final attempt)
-            if resp.status_code in _RETRY_STATUS and attempt < retries:
-                sleep_s = backoff * (2 ** (attempt - 1))
-                time.sleep(sleep_s)
-                continue
-
-            # Raise for other non-OK codes
-            resp.raise_for_status()
+            # Fail on other non-OK codes (transient ones were already retried)
+            if resp.status >= 400:
+                raise ConnectionError(
+                    f"Failed to download ELF from {url}: HTTP {resp.status}"
+                )
 
             # Basic sanity checks: content-type and size
             ctype = (resp.headers.get("Content-Type") or "").lower()
             if "html" in ctype:
                 raise ValueError(f"Expected ELF bytes, got {ctype} from {url}")
 
-            return io.BytesIO(resp.content)
-
-        except (requests.Timeout, requests.ConnectionError) as e:
-            last_err = e
-            if attempt < retries:
-                sleep_s = backoff * (2 ** (attempt - 1))
-                time.sleep(sleep_s)
-                continue
-            raise ConnectionError(f"Failed to download ELF from {url}: {e}") from e
+            length = resp.headers.get("Content-Length")
+            if length and int(length) > _MAX_ELF_BYTES:
+                raise ValueError(
+                    f"ELF from {url} is {length} bytes, over the {_MAX_ELF_BYTES} byte limit"
+                )
+
+            # Check the magic before buffering the rest of the body
+            head = resp.read(len(_ELF_MAGIC))
+            if head != _ELF_MAGIC:
+                raise ValueError(f"Expected ELF bytes from {url}, got {head!r}...")
+
+            buf = io.BytesIO()
+            buf.write(head)
+            for chunk in resp.stream(1024 * 1024):
+                buf.write(chunk)
+                # Content-Length may be missing or wrong; enforce the cap anyway
+                if buf.tell() > _MAX_ELF_BYTES:
+                    raise ValueError(
+                        f"ELF from {url} exceeds the {_MAX_ELF_BYTES} byte limit"
+                    )
+            buf.seek(0)
 
-        except Exception as e:
+            etag = resp.headers.get("ETag")
+            if etag:
+                _store_cached_elf(cached_elf, cached_etag, buf, etag)
+            return buf
+        except BaseException:
+            # Don't hand a connection with an unread body back to the pool
+            resp.close()
             raise
+        finally:
+            resp.release_conn()
+
+    except urllib3.exceptions.HTTPError as e:
+        raise ConnectionError(f"Failed to download ELF from {url}: {e}") from e
+
+
+def fetch_elfs(boards: List[str], timeout: float = 20.0) -> Dict[str, io.BytesIO]:
+    """
+    Download the ELFs for several boards concurrently.
+
+    Each board is fetched with :func:`fetch_elf` on a small thread pool sharing
+    the module's connection pool, so network round-trips overlap.
+
+    Board names are normalized (stripped, lowercased) the same way
+    :func:`fetch_elf` does before duplicates are dropped, so each board is
+    downloaded at most once.
 
-    # Should not reach here; defensive:
-    raise ConnectionError(f"Failed to download ELF from {url}: {last_err}")
+    Returns
+    -------
+    dict[str, io.BytesIO]
+        Mapping of normalized board name to its ELF bytes, in the order given.
+
+    Raises
+    ------
+    Whatever :func:`fetch_elf` raises for the first board that fails.
+    """
+    # Non-strings are passed through untouched so fetch_elf reports them
+    unique = list(
+        dict.fromkeys(b.strip().lower() if isinstance(b, str) else b for b in boards)
+    )
+    if not unique:
+        return {}
+
+    workers = min(_MAX_PARALLEL_FETCHES, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        bufs = pool.map(lambda board: fetch_elf(board, timeout=timeout), unique)
+        return dict(zip(unique, bufs))
@@ -0,0 +1,117 @@
+import base64
+import io
+import os
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("elftools")
+pylink = pytest.importorskip("pylink")
+
+from elftools.elf.elffile import ELFFile  # noqa: E402
+
+from hubbledemo import elfmgr, patch_elf  # noqa: E402
+
+_MERGE_DIR = Path(__file__).resolve().parents[2] / "merge"
+_ELF_BOARDS = sorted(p.stem for p in _MERGE_DIR.glob("*.elf"))
+
+# Flash contents outside the image, so preserved bytes can be told apart from
+# erased (0xFF) ones
+_FILL = 0xA5
+
+
+class FakeJLink:
+    """Target flash as a sparse byte map; only whole-sector writes are allowed."""
+
+    def __init__(self, sector_bytes: int, short_read: int = 0):
+        self.sector_bytes = sector_bytes
+        self.short_read = short_read
+        self.mem = {}
+        self.writes = []
+
+    def memory_read8(self, addr, n):
+        data = [self.mem.get(addr + i, _FILL) for i in range(n)]
+        return data[: n - self.short_read]
+
+    def flash_write8(self, addr, data):
+        assert addr % self.sector_bytes == 0, hex(addr)
+        assert len(data) % self.sector_bytes == 0, len(data)
+        self.writes.append((addr, len(data)))
+        self.mem.update(zip(range(addr, addr + len(data)), data))
+
+
+def _load(board: str) -> io.BytesIO:
+    return io.BytesIO((_MERGE_DIR / f"{board}.elf").read_bytes())
+
+
+def _patched(board: str) -> io.BytesIO:
+    buf = _load(board)
+    key = base64.b64encode(os.urandom(32)).decode()
+    patch_elf(buf, types.SimpleNamespace(key=key))
+    return buf
+
+
+def _segments(buf: io.BytesIO):
+    elf = ELFFile(io.BytesIO(buf.getvalue()))
+    for seg in elf.iter_segments():
+        if seg["p_type"] == "PT_LOAD" and seg["p_filesz"]:
+            yield elfmgr._addr_for_segment(seg), seg.data()
+
+
+def test_every_merged_image_has_a_board_entry():
+    assert _ELF_BOARDS
+    assert set(_ELF_BOARDS) == set(elfmgr._BOARDS)
+
+
+@pytest.mark.parametrize("board", _ELF_BOARDS)
+def test_flash_changed_sectors_writes_image_and_preserves_rest(board):
+    sector_bytes = elfmgr._BOARDS[board].sector_bytes
+    jlink = FakeJLink(sector_bytes)
+
+    elfmgr._flash_changed_sectors(jlink, _load(board), sector_bytes)
+    buf = _patched(board)
+    jlink.writes = []
+    written = elfmgr._flash_changed_sectors(jlink, buf, sector_bytes)
+
+    # Only the sectors holding the patched symbols are rewritten
+    assert written == sum(n for _, n in jlink.writes)
+    assert 0 < len(jlink.writes) <= 2
+
+    covered = set()
+    for addr, data in _segments(buf):
+        assert bytes(jlink.mem[addr + i] for i in range(len(data))) == data
+        covered.update(range(addr, addr + len(data)))
+    assert all(v == _FILL for k, v in jlink.mem.items() if k not in covered)
+
+
+@pytest.mark.parametrize("board", _ELF_BOARDS)
+def test_flash_changed_sectors_is_noop_when_target_matches(board):
+    sector_bytes = elfmgr._BOARDS[board].sector_bytes
+    jlink = FakeJLink(sector_bytes)
+    buf = _patched(board)
+
+    elfmgr._flash_changed_sectors(jlink, buf, sector_bytes)
+    jlink.writes = []
+
+    assert elfmgr._flash_changed_sectors(jlink, buf, sector_bytes) == 0
+    assert jlink.writes == []
+
+
+def test_flash_changed_sectors_short_read_writes_every_sector():
+    board = "nrf52dk"
+    sector_bytes = elfmgr._BOARDS[board].sector_bytes
+    buf = _patched(board)
+    jlink = FakeJLink(sector_bytes, short_read=1)
+
+    written = elfmgr._flash_changed_sectors(jlink, buf, sector_bytes)
+
+    sectors = {
+        base
+        for addr, data in _segments(buf)
+        for base in range(
+            addr - addr % sector_bytes, addr + len(data), sector_bytes
+        )
+    }
+    assert written == sum(n for _, n in jlink.writes)
+    assert written == len(sectors) * sector_bytes